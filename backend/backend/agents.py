@@ -125,3 +125,16 @@ router_agent = LlmAgent(
     ),
     output_key="routing_decision"
 )
+
+# General Assistant - answers GENERAL_ROUTE queries not covered by the FAQ index
+general_assistant = LlmAgent(
+    name="general_assistant",
+    model=_llm(),
+    instruction=(
+        "You are a friendly, helpful general assistant in a multi-agent demo. "
+        "Answer the user's question directly and concisely. "
+        "If it fits, mention that you can also look up weather for any city, "
+        "research and summarize URLs or topics, and compare options from multiple perspectives."
+    ),
+    output_key="general_response"
+)
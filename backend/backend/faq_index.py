@@ -0,0 +1,159 @@
+from __future__ import annotations
+import re
+import logging
+from difflib import SequenceMatcher
+from typing import Dict, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# Local canned-answer index for the general route.
+# Common questions are answered from here without any model call;
+# everything else falls through to the router and the general_assistant LLM agent.
+
+CAPABILITIES_ANSWER = (
+    "I can help you with:\n"
+    "• 🌤️ Weather information for any city (e.g. 'Weather in Tokyo')\n"
+    "• 🔍 Research and analysis of URLs or topics (e.g. 'Summarize https://ai.google.dev')\n"
+    "• 📊 Technical summaries and insights for engineering managers\n"
+    "• 🤝 Multi-perspective comparisons (e.g. 'Compare different AI models')\n"
+    "• 💬 General questions — just ask!"
+)
+
+GREETING_ANSWER = (
+    "Hi there! 👋 What can I do for you today?\n\n" + CAPABILITIES_ANSWER
+)
+
+HOW_ARE_YOU_ANSWER = (
+    "I'm doing well, thanks for asking! 😊\n\n" + CAPABILITIES_ANSWER
+)
+
+ABOUT_ANSWER = (
+    "I'm a multi-agent assistant built with Google ADK, LiteLLM and the AG‑UI protocol. "
+    "An intelligent router sends your question to the right agent: a weather tool, "
+    "a sequential research pipeline, a parallel collaboration team, or a general assistant."
+)
+
+THANKS_ANSWER = "You're welcome! Let me know if there's anything else I can help with."
+
+# Each entry: canned answer plus the question phrasings that should hit it.
+FAQ_ENTRIES: list[Dict[str, Any]] = [
+    {
+        "answer": CAPABILITIES_ANSWER,
+        "questions": [
+            "what can you help with",
+            "what can you help me with",
+            "what can you do",
+            "what do you do",
+            "how can you help",
+            "how can you help me",
+            "what are your capabilities",
+            "help",
+        ],
+    },
+    {
+        "answer": GREETING_ANSWER,
+        "questions": [
+            "hello",
+            "hi",
+            "hey",
+        ],
+    },
+    {
+        "answer": HOW_ARE_YOU_ANSWER,
+        "questions": [
+            "how are you",
+            "hello how are you",
+            "hi how are you",
+            "hey how are you",
+        ],
+    },
+    {
+        "answer": ABOUT_ANSWER,
+        "questions": [
+            "who are you",
+            "what are you",
+            "how do you work",
+            "how does this work",
+        ],
+    },
+    {
+        "answer": THANKS_ANSWER,
+        "questions": [
+            "thanks",
+            "thank you",
+            "thanks a lot",
+            "thank you very much",
+        ],
+    },
+]
+
+# Words that may be added or dropped without changing what is being asked.
+FILLER_WORDS = {
+    "please", "just", "exactly", "actually", "really", "so", "ok", "okay",
+    "there", "today", "now", "again", "all", "the", "me",
+}
+
+# Fuzzy matching only tolerates typos in longer words; short words must match exactly.
+TYPO_MIN_LENGTH = 5
+TYPO_THRESHOLD = 0.85
+# Maximum word-count difference between a query and a key for a fuzzy hit.
+MAX_WORD_DIFF = 2
+
+
+def normalize(text: str) -> str:
+    """Lowercase, strip punctuation and collapse whitespace."""
+    text = re.sub(r"[^\w\s]", " ", text.lower())
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def _same_word(a: str, b: str) -> bool:
+    if a == b:
+        return True
+    if min(len(a), len(b)) < TYPO_MIN_LENGTH:
+        return False
+    return SequenceMatcher(None, a, b).ratio() >= TYPO_THRESHOLD
+
+
+def _covers(words: set[str], others: set[str]) -> bool:
+    return all(any(_same_word(w, o) for o in others) for w in words)
+
+
+class FaqIndex:
+    """Exact plus token-based fuzzy lookup over the canned FAQ/capability answers.
+
+    A fuzzy hit requires the query and key to have a similar word count and the
+    same content words (filler words ignored, typos tolerated in long words only),
+    so a question that shares a phrase with a key but asks about something else misses.
+    """
+    def __init__(self, entries: list[Dict[str, Any]]):
+        self.exact: Dict[str, str] = {}
+        self.keys: list[tuple[str, list[str], set[str]]] = []
+        for entry in entries:
+            for question in entry["questions"]:
+                key = normalize(question)
+                self.exact[key] = entry["answer"]
+                words = key.split()
+                self.keys.append((key, words, set(words) - FILLER_WORDS))
+
+    def lookup(self, query: str) -> Optional[str]:
+        """Return a canned answer for the query, or None on a miss."""
+        key = normalize(query)
+        answer = self.exact.get(key)
+        if answer is not None:
+            logger.info(f"FAQ index hit: exact '{key}'")
+            return answer
+
+        words = key.split()
+        content = set(words) - FILLER_WORDS
+        if not content:
+            return None
+        for candidate, candidate_words, candidate_content in self.keys:
+            if abs(len(words) - len(candidate_words)) > MAX_WORD_DIFF:
+                continue
+            if _covers(content, candidate_content) and _covers(candidate_content, content):
+                logger.info(f"FAQ index hit: fuzzy '{key}' ~ '{candidate}'")
+                return self.exact[candidate]
+        return None
+
+
+faq_index = FaqIndex(FAQ_ENTRIES)
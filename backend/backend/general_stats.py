@@ -0,0 +1,99 @@
+from __future__ import annotations
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# Per-path metrics for the general route.
+# Both paths are timed from the moment the request arrives in agui_run,
+# so the LLM path includes the router model call that the FAQ path skips.
+
+
+@dataclass
+class LatencyStats:
+    """Count plus total/max latency for one measurement."""
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    def record(self, elapsed_ms: float) -> None:
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+    def avg_ms(self) -> float:
+        return round(self.total_ms / self.count, 2) if self.count else 0.0
+
+
+@dataclass
+class GeneralRouteStats:
+    """Hit rates and latencies for the FAQ index path and the general LLM path."""
+    faq_hits: LatencyStats = field(default_factory=LatencyStats)
+    faq_misses: LatencyStats = field(default_factory=LatencyStats)
+    llm_total: LatencyStats = field(default_factory=LatencyStats)
+    llm_first_delta: LatencyStats = field(default_factory=LatencyStats)
+    llm_incomplete: int = 0
+    llm_failed: int = 0
+
+    def record_faq_hit(self, elapsed_ms: float) -> None:
+        """Record a query answered from the FAQ index (request arrival → answer ready)."""
+        self.faq_hits.record(elapsed_ms)
+        logger.info(f"FAQ index answered in {elapsed_ms:.2f} ms")
+
+    def record_faq_miss(self, lookup_ms: float) -> None:
+        """Record the lookup cost of a FAQ miss, paid by every non-FAQ request."""
+        self.faq_misses.record(lookup_ms)
+
+    def record_llm(self, total_ms: float, first_delta_ms: Optional[float], completed: bool, failed: bool = False) -> None:
+        """Record a general-route query answered by the LLM, router call included.
+
+        An incomplete answer either failed (model/provider error) or was cut off by a client disconnect.
+        """
+        self.llm_total.record(total_ms)
+        if first_delta_ms is not None:
+            self.llm_first_delta.record(first_delta_ms)
+        if not completed:
+            self.llm_incomplete += 1
+        if failed:
+            self.llm_failed += 1
+        logger.info(
+            f"General assistant LLM path: total {total_ms:.2f} ms, "
+            f"first delta {'N/A' if first_delta_ms is None else f'{first_delta_ms:.2f} ms'}, "
+            f"completed={completed}, failed={failed}"
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        # Hit rates are relative to general-route queries only, so they add up to 1
+        general_queries = self.faq_hits.count + self.llm_total.count
+
+        def rate(count: int) -> float:
+            return round(count / general_queries, 4) if general_queries else 0.0
+
+        return {
+            "general_queries": general_queries,
+            "faq": {
+                "hits": self.faq_hits.count,
+                "hit_rate": rate(self.faq_hits.count),
+                "avg_latency_ms": self.faq_hits.avg_ms(),
+                "max_latency_ms": round(self.faq_hits.max_ms, 2),
+            },
+            "faq_misses": {
+                "count": self.faq_misses.count,
+                "avg_lookup_ms": self.faq_misses.avg_ms(),
+                "max_lookup_ms": round(self.faq_misses.max_ms, 2),
+            },
+            "llm": {
+                "answers": self.llm_total.count,
+                "hit_rate": rate(self.llm_total.count),
+                "incomplete": self.llm_incomplete,
+                "failed": self.llm_failed,
+                "avg_latency_ms": self.llm_total.avg_ms(),
+                "max_latency_ms": round(self.llm_total.max_ms, 2),
+                "avg_first_delta_ms": self.llm_first_delta.avg_ms(),
+                "max_first_delta_ms": round(self.llm_first_delta.max_ms, 2),
+            },
+        }
+
+
+general_stats = GeneralRouteStats()
@@ -1,5 +1,5 @@
 from __future__ import annotations
-import os, uuid, asyncio
+import os, uuid, asyncio, time, logging
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
@@ -15,11 +15,15 @@ os.environ["LITELLM_TURN_OFF_MESSAGE_LOGGING"] = "true"
 from .agui_protocol import (
     RunAgentInput, EventEncoder, run_started, run_finished, text_start, text_delta, text_end
 )
-from .orchestrator import run_sequential, run_collab, intelligent_router
+from .orchestrator import run_sequential, run_collab, intelligent_router, stream_general
+from .faq_index import faq_index
+from .general_stats import general_stats
 from .agents import web_researcher, technical_writer
 
 import httpx
 
+logger = logging.getLogger(__name__)
+
 async def geocode_city(city: str):
     url = "https://geocoding-api.open-meteo.com/v1/search"
     params = {"name": city, "count": 1}
@@ -79,6 +83,11 @@ async def ask_anything(body: RunBody):
     data = await intelligent_router(body.prompt)
     return JSONResponse(data)
 
+@app.get("/api/general/stats")
+async def api_general_stats():
+    """Hit rates and latencies for the FAQ index path and the general LLM path"""
+    return JSONResponse(general_stats.as_dict())
+
 
 @app.post("/api/agui/run")
 async def agui_run(request: Request):
@@ -86,10 +95,14 @@ async def agui_run(request: Request):
     if "thread_id" in payload and "run_id" in payload:
         input_data = RunAgentInput(**payload)
         prompt = " ".join([m.get("content","") for m in input_data.messages if m.get("role") in ("user","system")])
+        # The FAQ index only looks at the latest user turn, not the whole thread
+        user_messages = [m.get("content","") for m in input_data.messages if m.get("role") == "user"]
+        latest_message = user_messages[-1] if user_messages else prompt
         thread_id = input_data.thread_id
         run_id = input_data.run_id
     else:
         prompt = payload.get("prompt", "")
+        latest_message = prompt
         thread_id = str(uuid.uuid4())
         run_id = str(uuid.uuid4())
 
@@ -97,9 +110,26 @@ async def agui_run(request: Request):
     encoder = EventEncoder(accept=accept)
 
     async def gen():
+        # Both general-route paths are timed from request arrival
+        started = time.perf_counter()
+
         # lifecycle start
         yield encoder.encode(run_started(thread_id, run_id))
 
+        # --- FAQ Index: answer common questions instantly, skipping the router and LLM ---
+        lookup_started = time.perf_counter()
+        faq_answer = faq_index.lookup(latest_message)
+        if faq_answer is None:
+            general_stats.record_faq_miss((time.perf_counter() - lookup_started) * 1000)
+        else:
+            general_stats.record_faq_hit((time.perf_counter() - started) * 1000)
+            msg_faq = str(uuid.uuid4())
+            yield encoder.encode(text_start(msg_faq, agent_name="💬 General Assistant"))
+            yield encoder.encode(text_delta(msg_faq, faq_answer))
+            yield encoder.encode(text_end(msg_faq))
+            yield encoder.encode(run_finished(thread_id, run_id))
+            return
+
         # --- Intelligent Router: Analyze user query and route appropriately ---
         router_result = await intelligent_router(prompt)
         route_type = router_result.get("route_type", "GENERAL_ROUTE")
@@ -230,20 +260,30 @@ async def agui_run(request: Request):
                 yield encoder.encode(text_end(msg_complete))
             
         else:
-            # General query - use a simple LLM response
+            # General query - stream the general assistant's answer
             msg_general = str(uuid.uuid4())
-            yield encoder.encode(text_start(msg_general, agent_name="💬 General Assistant"))
-            
-            # For now, provide a simple response for general queries
-            general_response = f"I understand you're asking: '{prompt}'\n\n"
-            general_response += "I can help you with:\n"
-            general_response += "• 🌤️ Weather information for any city\n"
-            general_response += "• 🔍 Research and analysis of URLs or topics\n"
-            general_response += "• 📊 Technical summaries and insights\n\n"
-            general_response += "Could you be more specific about what you'd like me to help you with?"
-            
-            yield encoder.encode(text_delta(msg_general, general_response))
-            yield encoder.encode(text_end(msg_general))
+            first_delta_ms = None
+            completed = False
+            failed = False
+            try:
+                yield encoder.encode(text_start(msg_general, agent_name="💬 General Assistant"))
+                
+                try:
+                    async for delta in stream_general(prompt):
+                        if first_delta_ms is None:
+                            first_delta_ms = (time.perf_counter() - started) * 1000
+                        yield encoder.encode(text_delta(msg_general, delta))
+                except Exception:
+                    # Model/provider error: tell the user and let the run finish normally
+                    logger.exception("General assistant failed to stream an answer")
+                    failed = True
+                    yield encoder.encode(text_delta(msg_general, "Sorry, I couldn't generate an answer right now. Please try again in a moment."))
+                
+                yield encoder.encode(text_end(msg_general))
+                completed = not failed
+            finally:
+                # Recorded even when the stream fails or the client disconnects
+                general_stats.record_llm((time.perf_counter() - started) * 1000, first_delta_ms, completed, failed)
 
         # lifecycle end
         yield encoder.encode(run_finished(thread_id, run_id))
@@ -1,10 +1,11 @@
 from __future__ import annotations
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, AsyncIterator
+from google.adk.agents.run_config import RunConfig, StreamingMode
 from google.adk.runners import Runner
 from google.adk.sessions import InMemorySessionService
 from google.genai import types
-from .agents import sequential_orchestrator, collab_orchestrator, router_agent
+from .agents import sequential_orchestrator, collab_orchestrator, router_agent, general_assistant
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -228,3 +229,50 @@ async def intelligent_router(user_message: str) -> Dict[str, Any]:
         "original_query": user_message,
         "routing_decision": routing_decision
     }
+
+# Create the general assistant runner
+general_runner = Runner(
+    agent=general_assistant, 
+    app_name="General_APP", 
+    session_service=session_service
+)
+
+async def stream_general(user_message: str) -> AsyncIterator[str]:
+    """Stream the general assistant's answer as text deltas."""
+    import uuid
+    
+    # Create content from user input
+    content = types.Content(
+        role="user", 
+        parts=[types.Part(text=user_message)]
+    )
+    
+    # Create a unique session for this run
+    session_id = str(uuid.uuid4())
+    
+    await session_service.create_session(
+        app_name="General_APP", 
+        user_id=USER_ID, 
+        session_id=session_id
+    )
+    
+    # SSE streaming mode yields partial events with incremental text,
+    # followed by one aggregated final event with the full answer
+    streamed = False
+    async for event in general_runner.run_async(
+        user_id=USER_ID,
+        session_id=session_id,
+        new_message=content,
+        run_config=RunConfig(streaming_mode=StreamingMode.SSE)
+    ):
+        if not (event.content and event.content.parts):
+            continue
+        text = "".join(part.text for part in event.content.parts if part.text)
+        if not text:
+            continue
+        if event.partial:
+            streamed = True
+            yield text
+        elif not streamed:
+            # Provider did not stream; emit the final answer in one piece
+            yield text
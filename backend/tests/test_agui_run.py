@@ -0,0 +1,94 @@
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend import main
+from backend.faq_index import CAPABILITIES_ANSWER, THANKS_ANSWER
+from backend.general_stats import GeneralRouteStats
+
+
+@pytest.fixture
+def client(monkeypatch):
+    calls = {"router": 0}
+
+    async def fake_router(user_message):
+        calls["router"] += 1
+        return {"route_type": "GENERAL_ROUTE", "city": "N/A"}
+
+    async def fake_stream_general(user_message):
+        for delta in ["DNS maps ", "names to ", "addresses."]:
+            yield delta
+
+    monkeypatch.setattr(main, "intelligent_router", fake_router)
+    monkeypatch.setattr(main, "stream_general", fake_stream_general)
+    monkeypatch.setattr(main, "general_stats", GeneralRouteStats())
+    test_client = TestClient(main.app)
+    test_client.calls = calls
+    return test_client
+
+
+def run(client, payload):
+    res = client.post("/api/agui/run", json=payload, headers={"Accept": "application/json"})
+    assert res.status_code == 200
+    return [json.loads(line) for line in res.text.splitlines() if line]
+
+
+def deltas(events):
+    return [e["delta"] for e in events if e["type"] == "TEXT_MESSAGE_CONTENT"]
+
+
+def test_faq_hit_skips_router(client):
+    events = run(client, {"prompt": "What can you help with?"})
+    assert deltas(events) == [CAPABILITIES_ANSWER]
+    assert events[-1]["type"] == "RUN_FINISHED"
+    assert client.calls["router"] == 0
+
+
+def test_miss_streams_llm_deltas(client):
+    events = run(client, {"prompt": "how does dns work"})
+    assert client.calls["router"] == 1
+    assert deltas(events)[-3:] == ["DNS maps ", "names to ", "addresses."]
+    assert [e["type"] for e in events[-2:]] == ["TEXT_MESSAGE_END", "RUN_FINISHED"]
+
+
+def test_faq_uses_latest_user_message(client):
+    events = run(client, {
+        "thread_id": "t1",
+        "run_id": "r1",
+        "messages": [
+            {"role": "user", "content": "how does dns work"},
+            {"role": "assistant", "content": "DNS maps names to addresses."},
+            {"role": "user", "content": "thanks"},
+        ],
+    })
+    assert deltas(events) == [THANKS_ANSWER]
+    assert client.calls["router"] == 0
+
+
+def test_llm_error_finishes_run(client, monkeypatch):
+    async def failing_stream_general(user_message):
+        yield "Partial "
+        raise RuntimeError("provider down")
+
+    monkeypatch.setattr(main, "stream_general", failing_stream_general)
+    events = run(client, {"prompt": "how does dns work"})
+    assert "Sorry" in deltas(events)[-1]
+    assert [e["type"] for e in events[-2:]] == ["TEXT_MESSAGE_END", "RUN_FINISHED"]
+    stats = client.get("/api/general/stats").json()
+    assert stats["llm"]["failed"] == 1
+    assert stats["llm"]["incomplete"] == 1
+
+
+def test_stats_report_both_paths(client):
+    run(client, {"prompt": "hi"})
+    run(client, {"prompt": "how does dns work"})
+    res = client.get("/api/general/stats")
+    assert res.status_code == 200
+    stats = res.json()
+    assert stats["general_queries"] == 2
+    assert stats["faq"]["hits"] == 1
+    assert stats["faq_misses"]["count"] == 1
+    assert stats["llm"]["answers"] == 1
+    assert stats["llm"]["incomplete"] == 0
+    assert stats["llm"]["avg_first_delta_ms"] > 0
@@ -0,0 +1,43 @@
+import pytest
+
+from backend.faq_index import (
+    faq_index, CAPABILITIES_ANSWER, GREETING_ANSWER, HOW_ARE_YOU_ANSWER, ABOUT_ANSWER, THANKS_ANSWER,
+)
+
+
+@pytest.mark.parametrize("prompt, answer", [
+    ("What can you help with?", CAPABILITIES_ANSWER),
+    ("what can you help me with", CAPABILITIES_ANSWER),
+    ("So what can you do exactly?", CAPABILITIES_ANSWER),
+    ("what are your capabilites", CAPABILITIES_ANSWER),
+    ("hi", GREETING_ANSWER),
+    ("Hello there!", GREETING_ANSWER),
+    ("Hello, how are you?", HOW_ARE_YOU_ANSWER),
+    ("how are you today", HOW_ARE_YOU_ANSWER),
+    ("Who are you?", ABOUT_ANSWER),
+    ("thanks!", THANKS_ANSWER),
+    ("ok thank you", THANKS_ANSWER),
+])
+def test_hits(prompt, answer):
+    assert faq_index.lookup(prompt) == answer
+
+
+@pytest.mark.parametrize("prompt", [
+    "how does dns work",
+    "how do magnets work",
+    "how do I work",
+    "how can you tell",
+    "what can you read",
+    "what can I do",
+    "who r you",
+    "what r you",
+    "help me plan a trip",
+    "What's the weather in Tokyo?",
+    "Summarize https://ai.google.dev",
+    "Compare different AI models",
+    "",
+    "please",
+])
+def test_misses(prompt):
+    assert faq_index.lookup(prompt) is None
+
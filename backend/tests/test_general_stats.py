@@ -0,0 +1,22 @@
+import pytest
+
+from backend.general_stats import GeneralRouteStats
+
+
+def test_general_route_hit_rates_add_up():
+    stats = GeneralRouteStats()
+    stats.record_faq_miss(0.1)
+    stats.record_faq_miss(0.1)
+    stats.record_faq_hit(0.5)
+    stats.record_llm(900.0, 400.0, completed=True)
+    stats.record_llm(300.0, None, completed=False)
+    stats.record_llm(200.0, None, completed=False, failed=True)
+    data = stats.as_dict()
+    assert data["general_queries"] == 4
+    assert data["faq"]["hits"] == 1
+    assert data["faq_misses"]["count"] == 2
+    assert data["llm"]["answers"] == 3
+    assert data["llm"]["incomplete"] == 2
+    assert data["llm"]["failed"] == 1
+    assert data["llm"]["avg_first_delta_ms"] == 400.0
+    assert data["faq"]["hit_rate"] + data["llm"]["hit_rate"] == pytest.approx(1.0)